@@ -1,56 +1,296 @@
 #!/usr/bin/env python3
 # Import necessary libraries
 import sys
-import requests
-from bs4 import BeautifulSoup
-import lxml
+import asyncio
+import httpx
+from lxml import etree
 import smtplib
 import re
-import json
+import orjson
 import time
-from urllib.parse import urlparse
+import random
+import zlib
 import typer
 from typing import Optional, List, Dict
 import os
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
+try:
+    import redis
+    from redis.backoff import NoBackoff
+    from redis.retry import Retry as RedisRetry
+except ImportError:
+    redis = None
+
+try:
+    from paapi5_python_sdk.api.default_api import DefaultApi
+    from paapi5_python_sdk.models.get_items_request import GetItemsRequest
+    from paapi5_python_sdk.models.get_items_resource import GetItemsResource
+    from paapi5_python_sdk.models.partner_type import PartnerType
+    from paapi5_python_sdk.rest import ApiException
+except ImportError:
+    DefaultApi = None
+
 # Load environment variables from .env file
 load_dotenv()
 
 app = typer.Typer()
 
-def extract_asin(url: str) -> Optional[str]:
+# Headers to mimic a browser visit
+HEADERS = {
+    'Accept-Language': "en-US,en;q=0.9",
+    'User-Agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36 Edg/107.0.1418.35"
+}
+
+# User agents rotated between requests
+USER_AGENTS = [
+    HEADERS['User-Agent'],
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+]
+
+# Status codes Amazon uses to throttle scrapers, and the backoff applied per host
+THROTTLE_STATUS_CODES = {429, 503}
+THROTTLE_BASE_SECONDS = 30
+THROTTLE_MAX_SECONDS = 3600
+
+# Connection pool limits shared by all HTTP clients
+LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# ASIN patterns, compiled once at import time: /dp/ASIN and /gp/product/ASIN take
+# priority over a bare /ASIN segment anywhere in the URL
+_ASIN_RE = re.compile(r'/(?:dp|gp/product)/([A-Z0-9]{10})(?:/|\?|$)')
+_BARE_ASIN_RE = re.compile(r'/([A-Z0-9]{10})(?:/|\?|$)')
+
+# Dollars and optional cents of a displayed price such as "$1,299.99"
+_CENTS_RE = re.compile(r'(\d+)(?:\.(\d{2}))?')
+
+# Shared HTTP/2 clients so repeated checks reuse the same TCP/TLS connections
+CLIENT = httpx.Client(http2=True, headers=HEADERS, limits=LIMITS, timeout=10.0)
+TELEGRAM_CLIENT = httpx.Client(http2=True, limits=LIMITS, timeout=10.0)
+
+# Number of product pages check_price fetches in parallel
+MAX_WORKERS = 16
+
+# Size of the chunks product pages are streamed in
+CHUNK_SIZE = 65536
+
+# Maximum number of ASINs in a single PA-API GetItems request, and the spacing
+# between requests to stay within the default quota of one request per second
+PAAPI_BATCH_SIZE = 10
+PAAPI_REQUEST_INTERVAL = 1.1
+
+# Maximum length of a single Telegram message
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+# Bounds for the adaptive per-product polling interval, in seconds
+MIN_POLL_SECONDS = 300
+MAX_POLL_SECONDS = 7200
+POLL_BACKOFF = 1.5
+
+# Optional Redis store for cached pages and monitoring state shared between workers,
+# the page TTL should outlive the polling interval for conditional requests to pay off
+CACHE = redis.Redis(
+    host=os.getenv('REDIS_HOST', 'localhost'),
+    port=int(os.getenv('REDIS_PORT', '6379')),
+    socket_connect_timeout=1,
+    socket_timeout=1,
+    # Redis is best-effort, fail fast instead of retrying when Redis is down
+    retry=RedisRetry(NoBackoff(), 0)
+) if redis else None
+CACHE_TTL = int(os.getenv('CACHE_TTL', '3600'))
+NOTIFIED_KEY = "notified:free_shipping"
+
+# Per-host throttling state: when requests may resume, and consecutive throttled responses
+_HOST_BACKOFF: Dict[str, float] = {}
+_HOST_FAILURES: Dict[str, int] = {}
+
+# Parsed products files, keyed by path and invalidated by mtime
+_PRODUCTS_CACHE: Dict[str, tuple[int, List[Dict]]] = {}
+
+# Fallback for notification state when Redis is unavailable
+_NOTIFIED: set[str] = set()
+
+def encode_flag(flag: Optional[bool]) -> str:
     """
-    Extract ASIN from Amazon product URL
+    Encode an optional flag for storage in Redis
+
+    Args:
+        flag (bool): Flag to encode (optional)
+
+    Returns:
+        str: '1', '0', or '' if unknown
+    """
+    return '' if flag is None else str(int(flag))
+
+def decode_flag(value: str) -> Optional[bool]:
+    """
+    Decode an optional flag stored in Redis
+
+    Args:
+        value (str): Encoded flag
+
+    Returns:
+        bool: Decoded flag, or None if unknown
+    """
+    return None if value == '' else value == '1'
+
+def parse_cents(price: str) -> Optional[int]:
+    """
+    Parse a displayed price into integer cents
+
+    Args:
+        price (str): Displayed price, e.g. "$1,299.99"
+
+    Returns:
+        int: Price in cents, or None if it couldn't be parsed
+    """
+    price_match = _CENTS_RE.search(price.replace(',', ''))
+    if not price_match:
+        return None
+    return int(price_match.group(1)) * 100 + int(price_match.group(2) or 0)
+
+def format_price(cents: int) -> str:
+    """
+    Format integer cents as a displayed price
+
+    Args:
+        cents (int): Price in cents
+
+    Returns:
+        str: Displayed price, e.g. "$1299.99"
+    """
+    return f"${cents // 100}.{cents % 100:02d}"
+
+def describe_shipping(free_shipping: Optional[bool]) -> str:
+    """
+    Describe the shipping status of a product
+
+    Args:
+        free_shipping (bool): Whether shipping is free (optional)
+
+    Returns:
+        str: "FREE", "Not free" or "Unknown"
+    """
+    if free_shipping is None:
+        return "Unknown"
+    return "FREE" if free_shipping else "Not free"
+
+def get_cached_page(url: str) -> Dict[str, str]:
+    """
+    Look up cached validators and prices for a product page
 
     Args:
         url (str): Amazon product URL
 
     Returns:
-        str: ASIN or None if not found
+        Dict[str, str]: Cached fields, empty if not cached or Redis is unavailable
     """
-    # Extract ASIN using regex pattern for /dp/ASIN format
-    asin_match = re.search(r'/dp/([A-Z0-9]{10})(?:/|\?|$)', url)
+    if CACHE is None:
+        return {}
+    try:
+        cached = CACHE.hgetall(f"page:{url}")
+    except redis.RedisError:
+        return {}
+    cached = {key.decode(): value.decode() for key, value in cached.items()}
 
-    # If no match found, try another common pattern
-    if not asin_match:
-        parsed_url = urlparse(url)
-        path_parts = parsed_url.path.split('/')
+    # Ignore incomplete entries, a conditional request would leave us without prices
+    if not cached.get('item', '').isdigit():
+        return {}
+    return cached
+
+def cached_prices(cached: Dict[str, str]) -> tuple[int, Optional[bool]]:
+    """
+    Decode the prices stored with a cached product page
 
-        # Check if path contains 'dp' followed by ASIN
-        for i, part in enumerate(path_parts):
-            if part == 'dp' and i+1 < len(path_parts) and len(path_parts[i+1]) == 10:
-                return path_parts[i+1]
+    Args:
+        cached (Dict[str, str]): Cached page fields
+
+    Returns:
+        tuple: (item_price, free_shipping)
+    """
+    return int(cached['item']), decode_flag(cached['delivery'])
 
-        # If still no match, look for any 10-character alphanumeric segment that might be ASIN
-        asin_match = re.search(r'/([A-Z0-9]{10})(?:/|\?|$)', url)
-        if asin_match:
-            return asin_match.group(1)
+def cache_page(url: str, etag: Optional[str], last_modified: Optional[str],
+               item_price: int, free_shipping: Optional[bool]) -> None:
+    """
+    Store validators and prices for a product page
 
+    Args:
+        url (str): Amazon product URL
+        etag (str): ETag response header (optional)
+        last_modified (str): Last-Modified response header (optional)
+        item_price (int): Parsed item price in cents
+        free_shipping (bool): Whether shipping is free (optional)
+    """
+    if CACHE is None or not (etag or last_modified):
+        return
+    key = f"page:{url}"
+    try:
+        pipe = CACHE.pipeline()
+        pipe.hset(key, mapping={
+            'etag': etag or '',
+            'last_modified': last_modified or '',
+            'item': item_price,
+            'delivery': encode_flag(free_shipping)
+        })
+        pipe.expire(key, CACHE_TTL)
+        pipe.execute()
+    except redis.RedisError:
+        pass
+
+def refresh_cached_page(url: str) -> None:
+    """
+    Extend the TTL of a cached product page after a 304 response
+
+    Args:
+        url (str): Amazon product URL
+    """
+    if CACHE is None:
+        return
+    try:
+        CACHE.expire(f"page:{url}", CACHE_TTL)
+    except redis.RedisError:
+        pass
+
+def conditional_headers(cached: Dict[str, str]) -> Dict[str, str]:
+    """
+    Build conditional request headers from cached validators
+
+    Args:
+        cached (Dict[str, str]): Cached page fields
+
+    Returns:
+        Dict[str, str]: If-None-Match / If-Modified-Since headers
+    """
+    headers = {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+    return headers
+
+@lru_cache(maxsize=1024)
+def extract_asin(url: str) -> Optional[str]:
+    """
+    Extract ASIN from Amazon product URL
+
+    Args:
+        url (str): Amazon product URL
+
+    Returns:
+        str: ASIN or None if not found
+    """
+    asin_match = _ASIN_RE.search(url) or _BARE_ASIN_RE.search(url)
+    if not asin_match:
         return None
-    else:
-        return asin_match.group(1)
+    return asin_match.group(1)
 
 def create_associate_url(asin: str, associate_id: str = None) -> str:
     """
@@ -67,44 +307,341 @@ def create_associate_url(asin: str, associate_id: str = None) -> str:
         associate_id = os.getenv('AMAZON_ASSOCIATE_ID', 'yourtrackingid')
     return f"https://www.amazon.com/dp/{asin}/ref=nosim?tag={associate_id}"
 
-def get_amazon_price(url: str) -> tuple[Optional[str], Optional[str]]:
+class PriceScanner:
+    """
+    Incrementally parse an Amazon product page and pick out the product price and
+    shipping status, so the download can stop as soon as both have been seen
+    """
+
+    def __init__(self):
+        self.parser = etree.HTMLPullParser(events=('end',), tag='span')
+        self.item_price: Optional[int] = None
+        self.free_shipping: Optional[bool] = None
+        self.delivery_seen = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Feed the next chunk of the page
+
+        Args:
+            chunk (bytes): Raw HTML chunk
+
+        Returns:
+            bool: True once both prices have been found
+        """
+        self.parser.feed(chunk)
+        for _, element in self.parser.read_events():
+            if self.item_price is None and 'a-offscreen' in (element.get('class') or ''):
+                self.item_price = parse_cents(element.text or '')
+            if not self.delivery_seen and element.get('data-csa-c-content-id') == 'DEXUnifiedCXPDM':
+                delivery_price = element.get('data-csa-c-delivery-price')
+                self.free_shipping = delivery_price.lower() == 'free' if delivery_price else None
+                self.delivery_seen = True
+        return self.item_price is not None and self.delivery_seen
+
+    def result(self) -> tuple[Optional[int], Optional[bool]]:
+        """
+        Return the prices found so far
+
+        Returns:
+            tuple: (item_price in cents, free_shipping)
+        """
+        if self.item_price is None:
+            print("Error: Could not find price elements on the page")
+            return None, None
+
+        return self.item_price, self.free_shipping
+
+def is_backed_off(host: str) -> bool:
+    """
+    Check whether requests to a host are paused after it throttled us
+
+    Args:
+        host (str): Host name
+
+    Returns:
+        bool: True if the host should not be contacted yet
+    """
+    return time.time() < _HOST_BACKOFF.get(host, 0)
+
+def update_backoff(host: str, status_code: int) -> None:
+    """
+    Back off exponentially from a host that throttles us, reset once it stops
+
+    Args:
+        host (str): Host name
+        status_code (int): Status code of the last response from the host
+    """
+    if status_code in THROTTLE_STATUS_CODES:
+        # Concurrent requests throttled together count as a single episode
+        if is_backed_off(host):
+            return
+        failures = _HOST_FAILURES.get(host, 0)
+        _HOST_FAILURES[host] = failures + 1
+        _HOST_BACKOFF[host] = time.time() + min(2 ** failures * THROTTLE_BASE_SECONDS, THROTTLE_MAX_SECONDS)
+    else:
+        _HOST_FAILURES.pop(host, None)
+        _HOST_BACKOFF.pop(host, None)
+
+def request_headers(cached: Dict[str, str]) -> Dict[str, str]:
+    """
+    Build per-request headers: a rotated user agent plus any conditional headers
+
+    Args:
+        cached (Dict[str, str]): Cached page fields
+
+    Returns:
+        Dict[str, str]: Request headers
+    """
+    return {'User-Agent': random.choice(USER_AGENTS), **conditional_headers(cached)}
+
+def record_price(asin: str, item_price: int, free_shipping: Optional[bool]) -> None:
+    """
+    Store the latest price check for a product
+
+    Args:
+        asin (str): Amazon ASIN
+        item_price (int): Item price in cents
+        free_shipping (bool): Whether shipping is free (optional)
+    """
+    if CACHE is None:
+        return
+    try:
+        CACHE.hset(f"price:{asin}", mapping={
+            'item': item_price,
+            'delivery': encode_flag(free_shipping),
+            'ts': time.time()
+        })
+    except redis.RedisError:
+        pass
+
+def claim_notification(asin: str) -> bool:
+    """
+    Mark a product as notified about free shipping
+
+    Args:
+        asin (str): Amazon ASIN
+
+    Returns:
+        bool: True if no worker has notified about this product yet
+    """
+    if CACHE is not None:
+        try:
+            return bool(CACHE.sadd(NOTIFIED_KEY, asin))
+        except redis.RedisError:
+            pass
+    if asin in _NOTIFIED:
+        return False
+    _NOTIFIED.add(asin)
+    return True
+
+def release_notification(asin: str) -> None:
+    """
+    Clear the notified mark of a product so the next free shipping is reported again
+
+    Args:
+        asin (str): Amazon ASIN
+    """
+    _NOTIFIED.discard(asin)
+    if CACHE is None:
+        return
+    try:
+        CACHE.srem(NOTIFIED_KEY, asin)
+    except redis.RedisError:
+        pass
+
+def get_amazon_price(url: str, client: Optional[httpx.Client] = None) -> tuple[Optional[int], Optional[bool]]:
     """
-    Scrape Amazon product page and return product price and delivery price
+    Scrape Amazon product page and return product price and whether shipping is free
 
     Args:
         url (str): Amazon product URL
+        client (httpx.Client): Client to send the request with (optional)
 
     Returns:
-        tuple: (item_price, delivery_price)
+        tuple: (item_price in cents, free_shipping)
     """
-    # Headers to mimic a browser visit
-    headers = {
-        'Accept-Language': "en-US,en;q=0.9",
-        'User-Agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36 Edg/107.0.1418.35"
-    }
+    if client is None:
+        client = CLIENT
+
+    host = httpx.URL(url).host
+    if is_backed_off(host):
+        print(f"Error: {host} is throttling requests, skipping")
+        return None, None
+
+    cached = get_cached_page(url)
 
     # Send a request to the URL
-    response = requests.get(url, headers=headers)
+    try:
+        with client.stream("GET", url, headers=request_headers(cached)) as response:
+            update_backoff(host, response.status_code)
+
+            # Page hasn't changed since the cached copy
+            if response.status_code == 304 and cached:
+                refresh_cached_page(url)
+                return cached_prices(cached)
+
+            # Check if request was successful
+            if response.status_code != 200:
+                print(f"Error: Unable to access the URL. Status code: {response.status_code}")
+                return None, None
+
+            # Stop downloading as soon as both prices have been seen
+            scanner = PriceScanner()
+            for chunk in response.iter_bytes(CHUNK_SIZE):
+                if scanner.feed(chunk):
+                    break
+    except httpx.HTTPError as e:
+        print(f"Error: Unable to access the URL: {e}")
+        return None, None
+
+    item_price, free_shipping = scanner.result()
+    if item_price is not None:
+        cache_page(url, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                   item_price, free_shipping)
+    return item_price, free_shipping
 
-    # Check if request was successful
-    if response.status_code != 200:
-        print(f"Error: Unable to access the URL. Status code: {response.status_code}")
+async def fetch_price(client: httpx.AsyncClient, url: str) -> tuple[Optional[int], Optional[bool]]:
+    """
+    Asynchronously fetch Amazon product page and return product price and whether shipping is free
+
+    Args:
+        client (httpx.AsyncClient): Client to send the request with
+        url (str): Amazon product URL
+
+    Returns:
+        tuple: (item_price in cents, free_shipping)
+    """
+    host = httpx.URL(url).host
+    if is_backed_off(host):
+        print(f"Error: {host} is throttling requests, skipping")
         return None, None
 
-    # Parse the HTML content of the page
-    soup = BeautifulSoup(response.content, "lxml")
+    # Redis calls block, keep them off the event loop
+    cached = await asyncio.to_thread(get_cached_page, url)
 
-    # Find the element that contains the price
     try:
-        item_price = soup.find("span", class_="a-offscreen").getText()
-        delivery_price_element = soup.find("span", {"data-csa-c-content-id": "DEXUnifiedCXPDM"})
-        delivery_price = delivery_price_element.get("data-csa-c-delivery-price") if delivery_price_element else None
-
-        return item_price, delivery_price
-    except AttributeError:
-        print("Error: Could not find price elements on the page")
+        async with client.stream("GET", url, headers=request_headers(cached)) as response:
+            update_backoff(host, response.status_code)
+
+            # Page hasn't changed since the cached copy
+            if response.status_code == 304 and cached:
+                await asyncio.to_thread(refresh_cached_page, url)
+                return cached_prices(cached)
+
+            if response.status_code != 200:
+                print(f"Error: Unable to access the URL. Status code: {response.status_code}")
+                return None, None
+
+            # Stop downloading as soon as both prices have been seen,
+            # parsing is CPU-bound so keep it off the event loop
+            scanner = PriceScanner()
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                if await asyncio.to_thread(scanner.feed, chunk):
+                    break
+    except httpx.HTTPError as e:
+        print(f"Error: Unable to access the URL: {e}")
         return None, None
 
+    item_price, free_shipping = scanner.result()
+    if item_price is not None:
+        await asyncio.to_thread(cache_page, url, response.headers.get('ETag'),
+                                response.headers.get('Last-Modified'), item_price, free_shipping)
+    return item_price, free_shipping
+
+def create_paapi_client() -> Optional["DefaultApi"]:
+    """
+    Create a Product Advertising API client from environment variables
+
+    Returns:
+        DefaultApi: PA-API client, or None if the SDK or credentials are missing
+    """
+    access_key = os.getenv('AMAZON_ACCESS_KEY')
+    secret_key = os.getenv('AMAZON_SECRET_KEY')
+    if DefaultApi is None or not access_key or not secret_key:
+        return None
+
+    return DefaultApi(
+        access_key=access_key,
+        secret_key=secret_key,
+        host=os.getenv('AMAZON_PAAPI_HOST', 'webservices.amazon.com'),
+        region=os.getenv('AMAZON_PAAPI_REGION', 'us-east-1')
+    )
+
+def get_paapi_prices(api: "DefaultApi", asins: List[str], associate_id: str = None) -> Dict[str, tuple[Optional[int], Optional[bool]]]:
+    """
+    Look up product price and shipping status for up to PAAPI_BATCH_SIZE products in one PA-API request
+
+    Args:
+        api (DefaultApi): PA-API client
+        asins (List[str]): Amazon ASINs
+        associate_id (str): Your Amazon Associate ID (optional)
+
+    Returns:
+        Dict[str, tuple]: (item_price in cents, free_shipping) by ASIN, for the products PA-API returned
+    """
+    if associate_id is None:
+        associate_id = os.getenv('AMAZON_ASSOCIATE_ID', 'yourtrackingid')
+
+    request = GetItemsRequest(
+        partner_tag=associate_id,
+        partner_type=PartnerType.ASSOCIATES,
+        marketplace="www.amazon.com",
+        item_ids=asins,
+        resources=[
+            GetItemsResource.OFFERS_LISTINGS_PRICE,
+            GetItemsResource.OFFERS_LISTINGS_DELIVERYINFO_ISFREESHIPPINGELIGIBLE
+        ]
+    )
+
+    try:
+        response = api.get_items(request)
+    except ApiException as e:
+        print(f"Error: PA-API request failed. Status code: {e.status}")
+        return {}
+    except Exception as e:
+        # The SDK lets connection and DNS errors from urllib3 through unwrapped
+        print(f"Error: PA-API request failed: {e}")
+        return {}
+
+    for error in response.errors or []:
+        print(f"Error: PA-API {error.code}: {error.message}")
+
+    prices = {}
+    items = response.items_result.items if response.items_result else []
+    for item in items or []:
+        if not item.offers or not item.offers.listings:
+            continue
+        listing = item.offers.listings[0]
+        item_price = None
+        if listing.price and listing.price.amount is not None:
+            item_price = round(listing.price.amount * 100)
+        elif listing.price and listing.price.display_amount:
+            item_price = parse_cents(listing.price.display_amount)
+        free_shipping = listing.delivery_info.is_free_shipping_eligible if listing.delivery_info else None
+        prices[item.asin] = (item_price, free_shipping)
+    return prices
+
+def get_all_paapi_prices(api: "DefaultApi", asins: List[str], associate_id: str = None) -> Dict[str, tuple[Optional[int], Optional[bool]]]:
+    """
+    Look up product price and shipping status for any number of products, one PA-API
+    request per PAAPI_BATCH_SIZE products, spaced out to respect the request quota
+
+    Args:
+        api (DefaultApi): PA-API client
+        asins (List[str]): Amazon ASINs
+        associate_id (str): Your Amazon Associate ID (optional)
+
+    Returns:
+        Dict[str, tuple]: (item_price in cents, free_shipping) by ASIN, for the products PA-API returned
+    """
+    prices = {}
+    for i in range(0, len(asins), PAAPI_BATCH_SIZE):
+        if i:
+            time.sleep(PAAPI_REQUEST_INTERVAL)
+        prices.update(get_paapi_prices(api, asins[i:i + PAAPI_BATCH_SIZE], associate_id))
+    return prices
+
 def send_telegram_message(message: str, bot_token: str = None, chat_id: str = None) -> bool:
     """
     Send a message via Telegram
@@ -134,12 +671,42 @@ def send_telegram_message(message: str, bot_token: str = None, chat_id: str = No
     }
 
     try:
-        response = requests.post(url, json=data)
+        response = TELEGRAM_CLIENT.post(
+            url,
+            content=orjson.dumps(data),
+            headers={"Content-Type": "application/json"}
+        )
         return response.status_code == 200
     except Exception as e:
         print(f"Error sending Telegram message: {e}")
         return False
 
+def batch_notifications(notifications: List[tuple[str, str, str]]) -> List[List[tuple[str, str, str]]]:
+    """
+    Group notifications into as few Telegram messages as the message size limit allows
+
+    Args:
+        notifications (List[tuple]): (name, asin, message) for each product to report
+
+    Returns:
+        List[List[tuple]]: Notifications to send together in each message
+    """
+    batches = []
+    batch = []
+    batch_length = 0
+    for notification in notifications:
+        # Messages in a batch are separated by a blank line
+        length = len(notification[2]) + 2
+        if batch and batch_length + length > TELEGRAM_MESSAGE_LIMIT:
+            batches.append(batch)
+            batch = []
+            batch_length = 0
+        batch.append(notification)
+        batch_length += length
+    if batch:
+        batches.append(batch)
+    return batches
+
 def load_products(filename: str = "products.json") -> List[Dict]:
     """
     Load product URLs from JSON file
@@ -150,22 +717,32 @@ def load_products(filename: str = "products.json") -> List[Dict]:
     Returns:
         List[Dict]: List of product dictionaries
     """
+    path = Path(filename)
     try:
-        with open(filename, 'r') as f:
-            return json.load(f)
+        # Skip parsing if the file hasn't changed since it was last loaded
+        mtime = path.stat().st_mtime_ns
+        cached = _PRODUCTS_CACHE.get(filename)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        products = orjson.loads(path.read_bytes())
+        _PRODUCTS_CACHE[filename] = (mtime, products)
+        return products
     except FileNotFoundError:
         print(f"Error: {filename} not found")
         return []
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"Error: {filename} is not valid JSON")
         return []
 
-def monitor_products(
+async def monitor_products(
     products: List[Dict],
     associate_id: str = None,
     bot_token: str = None,
     chat_id: str = None,
-    sleep_minutes: int = 20
+    sleep_minutes: int = 20,
+    worker_id: int = 0,
+    num_workers: int = 1
 ) -> None:
     """
     Monitor products until free shipping is available
@@ -175,84 +752,182 @@ def monitor_products(
         associate_id (str): Amazon Associate ID (optional)
         bot_token (str): Telegram bot token (optional)
         chat_id (str): Telegram chat ID (optional)
-        sleep_minutes (int): Minutes to sleep between checks
+        sleep_minutes (int): Initial minutes to sleep between checks of each product,
+            backed off while a product doesn't change and reset when it does
+        worker_id (int): Index of this worker, used to pick its share of the products
+        num_workers (int): Total number of workers monitoring the same products
     """
-    while True:
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"\nChecking prices at {current_time}")
-
-        for product in products:
-            url = product.get('url')
-            name = product.get('name', 'Unknown Product')
-
-            if not url:
-                continue
-
-            # Extract ASIN and create associate URL
-            asin = extract_asin(url)
-            if not asin:
-                print(f"Error: Could not extract ASIN from URL for {name}")
-                continue
-
-            associate_url = create_associate_url(asin, associate_id)
-
-            # Get price and shipping
-            item_price, delivery_price = get_amazon_price(associate_url)
-
-            if not item_price:
-                print(f"Error: Could not get price for {name}")
-                continue
+    # Resolve associate URLs once, they don't change between checks
+    targets = []
+    for product in products:
+        url = product.get('url')
+        name = product.get('name', 'Unknown Product')
+
+        if not url:
+            continue
+
+        # Extract ASIN and create associate URL
+        asin = extract_asin(url)
+        if not asin:
+            print(f"Error: Could not extract ASIN from URL for {name}")
+            continue
+
+        # Leave products that belong to other workers alone
+        if zlib.crc32(asin.encode()) % num_workers != worker_id:
+            continue
+
+        targets.append((name, asin, create_associate_url(asin, associate_id)))
+
+    if not targets:
+        if num_workers > 1:
+            print(f"No products to monitor for worker {worker_id} of {num_workers}.")
+        else:
+            print("No products to monitor. Please check the product URLs in your products file.")
+        return
 
-            # Check if shipping is free
-            if delivery_price and delivery_price.lower() == "free":
-                message = (
-                    f"🎉 Free shipping available for {name}!\n"
-                    f"Price: {item_price}\n"
-                    f"Link: {associate_url}"
+    # Per-product polling schedule, keyed by associate URL
+    base_delay = sleep_minutes * 60
+    next_check: Dict[str, float] = {associate_url: 0.0 for _, _, associate_url in targets}
+    delay: Dict[str, float] = {associate_url: base_delay for _, _, associate_url in targets}
+    last_seen: Dict[str, tuple[Optional[int], Optional[bool]]] = {}
+
+    paapi = create_paapi_client()
+    if paapi:
+        print("Using the Product Advertising API")
+
+    async with httpx.AsyncClient(http2=True, headers=HEADERS, limits=LIMITS, timeout=10.0) as client:
+        while True:
+            current_time = datetime.now().isoformat(sep=" ", timespec="seconds")
+            print(f"\nChecking prices at {current_time}")
+
+            # Only check products whose next check is due
+            now = time.time()
+            due = [target for target in targets if next_check[target[2]] <= now]
+
+            # Get price and shipping for all due products at once
+            if paapi:
+                # PA-API calls block and are rate limited, send the batches one after another in a thread
+                prices = await asyncio.to_thread(
+                    get_all_paapi_prices, paapi, [asin for _, asin, _ in due], associate_id
                 )
-
-                if send_telegram_message(message, bot_token, chat_id):
-                    print(f"Notification sent for {name}")
-                else:
-                    print(f"Failed to send notification for {name}")
+                results = [prices.get(asin, (None, None)) for _, asin, _ in due]
             else:
-                print(f"{name}: {item_price} (Shipping: {delivery_price or 'Unknown'})")
-
-        print(f"\nSleeping for {sleep_minutes} minutes...")
-        time.sleep(sleep_minutes * 60)
+                results = await asyncio.gather(*(fetch_price(client, associate_url) for _, _, associate_url in due))
+
+            notifications = []
+            now = time.time()
+            for (name, asin, associate_url), (item_price, free_shipping) in zip(due, results):
+                max_delay = max(MAX_POLL_SECONDS, base_delay)
+                previous = last_seen.get(associate_url)
+
+                # A failed fetch (captcha, throttling, timeout) isn't a change, back off from it
+                if item_price is None:
+                    delay[associate_url] = min(delay[associate_url] * POLL_BACKOFF, max_delay)
+                    next_check[associate_url] = now + delay[associate_url]
+                    print(f"Error: Could not get price for {name}")
+                    continue
+
+                # Poll products that just changed more often, back off from ones that don't
+                if previous is not None:
+                    if previous != (item_price, free_shipping):
+                        delay[associate_url] = min(MIN_POLL_SECONDS, base_delay)
+                    else:
+                        delay[associate_url] = min(delay[associate_url] * POLL_BACKOFF, max_delay)
+                last_seen[associate_url] = (item_price, free_shipping)
+                next_check[associate_url] = now + delay[associate_url]
+
+                await asyncio.to_thread(record_price, asin, item_price, free_shipping)
+
+                # Check if shipping is free
+                if free_shipping:
+                    # Only one worker reports each product becoming free to ship
+                    if not await asyncio.to_thread(claim_notification, asin):
+                        print(f"{name}: {format_price(item_price)} (Shipping: FREE, already notified)")
+                        continue
+
+                    message = (
+                        f"🎉 Free shipping available for {name}!\n"
+                        f"Price: {format_price(item_price)}\n"
+                        f"Link: {associate_url}"
+                    )
+                    notifications.append((name, asin, message))
+                else:
+                    # Re-arm the notification only once shipping is known to be paid again,
+                    # and skip the round-trip if it already was at the previous check
+                    if free_shipping is False and (previous is None or previous[1] is not False):
+                        await asyncio.to_thread(release_notification, asin)
+                    print(f"{name}: {format_price(item_price)} (Shipping: {describe_shipping(free_shipping)})")
+
+            # Report everything found in this check in as few Telegram messages as possible
+            batches = batch_notifications(notifications)
+            sends = (
+                asyncio.to_thread(send_telegram_message, "\n\n".join(message for _, _, message in batch), bot_token, chat_id)
+                for batch in batches
+            )
+            for batch, sent in zip(batches, await asyncio.gather(*sends)):
+                for name, asin, _ in batch:
+                    if sent:
+                        print(f"Notification sent for {name}")
+                    else:
+                        # Let the next check try again
+                        await asyncio.to_thread(release_notification, asin)
+                        print(f"Failed to send notification for {name}")
+
+            sleep_seconds = max(1, min(next_check.values()) - time.time())
+            print(f"\nSleeping for {sleep_seconds / 60:.1f} minutes...")
+            await asyncio.sleep(sleep_seconds)
 
 @app.command()
 def check_price(
-    url: str = typer.Argument(..., help="Amazon product URL"),
+    urls: List[str] = typer.Argument(..., help="Amazon product URLs"),
     associate_id: str = typer.Option(None, help="Your Amazon Associate ID (optional)")
 ):
-    """Check price for a single Amazon product"""
-    # Extract ASIN
-    asin = extract_asin(url)
-    if not asin:
-        print("Error: Could not extract ASIN from URL. Using original URL.")
-        asin_url = url
-    else:
-        asin_url = f"https://www.amazon.com/dp/{asin}"
-        print(f"Cleaned URL: {asin_url}")
-
-    associate_url = create_associate_url(asin, associate_id)
-    print(f"Associate URL: {associate_url}")
-    print(f"Processing URL: {associate_url}")
-
-    item_price, delivery_price = get_amazon_price(associate_url)
-
-    if item_price:
-        print(f"Item price: {item_price}")
-        print(f"Delivery price: {delivery_price}")
-    else:
-        print("Failed to retrieve price information")
+    """Check prices for one or more Amazon products"""
+    targets = []
+    for url in urls:
+        # Extract ASIN
+        asin = extract_asin(url)
+        if not asin:
+            print("Error: Could not extract ASIN from URL. Using original URL.")
+            asin_url = url
+        else:
+            asin_url = f"https://www.amazon.com/dp/{asin}"
+            print(f"Cleaned URL: {asin_url}")
+
+        associate_url = create_associate_url(asin, associate_id)
+        print(f"Associate URL: {associate_url}")
+        targets.append((asin, associate_url))
+
+    def report(associate_url: str, item_price: Optional[int], free_shipping: Optional[bool]) -> None:
+        print(f"\nResults for {associate_url}")
+        if item_price is not None:
+            print(f"Item price: {format_price(item_price)}")
+            print(f"Shipping: {describe_shipping(free_shipping)}")
+        else:
+            print("Failed to retrieve price information")
+
+    # Look products up through PA-API when it's configured, scraping is only needed without it
+    paapi = create_paapi_client()
+    if paapi:
+        prices = get_all_paapi_prices(paapi, [asin for asin, _ in targets if asin], associate_id)
+        for asin, associate_url in targets:
+            if asin:
+                report(associate_url, *prices.get(asin, (None, None)))
+        targets = [(asin, associate_url) for asin, associate_url in targets if not asin]
+
+    # Pages are fetched in parallel, the shared client pools the connections
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(get_amazon_price, associate_url): associate_url for _, associate_url in targets}
+        for future in as_completed(futures):
+            report(futures[future], *future.result())
 
 @app.command()
 def monitor(
     associate_id: str = typer.Option(None, help="Your Amazon Associate ID (optional)"),
     sleep_minutes: int = typer.Option(20, help="Minutes to sleep between checks"),
-    products_file: str = typer.Option("products.json", help="Path to products JSON file")
+    products_file: str = typer.Option("products.json", help="Path to products JSON file"),
+    worker_id: int = typer.Option(0, envvar="WORKER_ID", help="Index of this worker when sharding products"),
+    num_workers: int = typer.Option(1, envvar="NUM_WORKERS", help="Total number of workers sharding products")
 ):
     """Monitor products from JSON file until free shipping is available"""
     products = load_products(products_file)
@@ -260,8 +935,25 @@ def monitor(
         print("No products to monitor. Please check your products.json file.")
         return
 
+    if not 0 <= worker_id < num_workers:
+        print("Error: --worker-id must be between 0 and --num-workers - 1")
+        return
+
+    # uvloop is a faster drop-in event loop, it isn't available on every platform
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     print(f"Starting to monitor {len(products)} products...")
-    monitor_products(products, associate_id, sleep_minutes=sleep_minutes)
+    asyncio.run(monitor_products(
+        products,
+        associate_id,
+        sleep_minutes=sleep_minutes,
+        worker_id=worker_id,
+        num_workers=num_workers
+    ))
 
 if __name__ == "__main__":
     app()